@@ -2,32 +2,43 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
+import struct
 import time
 from datetime import timedelta
 import logging
+from operator import itemgetter
 
 from pymodbus.client import AsyncModbusTcpClient
+from pymodbus.exceptions import ConnectionException, ModbusException
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform, CONF_HOST, CONF_PORT, CONF_NAME
-from homeassistant.core import HomeAssistant
+from homeassistant.const import Platform, CONF_HOST, CONF_PORT, CONF_NAME, EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
 
 from .const import (
-    DOMAIN, DEFAULT_SCAN_INTERVAL,
+    DOMAIN, DEFAULT_SCAN_INTERVAL, ACTIVE_SCAN_INTERVAL, IDLE_SCAN_INTERVAL,
+    QUICK_RETRY_INTERVAL, MAX_RETRY_INTERVAL,
+    SLOW_SCAN_INTERVAL, FIRMWARE_REFRESH_INTERVAL, KEEPALIVE_INTERVAL,
+    CONF_MESSAGE_WAIT, DEFAULT_MESSAGE_WAIT, CONF_NUM_POINTS,
+    MAX_CONCURRENT_READS, MAX_CONSECUTIVE_FAILURES, READ_TIMEOUT, UPDATE_TIMEOUT,
+    RECONNECT_DELAY, RECONNECT_DELAY_MAX,
     # Registers
     REG_SYS_POWER_LIMIT, REG_SYS_MAX_SCHIEFLAST, REG_SYS_FALLBACK_POWER,
     REG_SYS_FW_PATCH, REG_SYS_NUM_POINTS, REG_SYS_ARTICLE_NUM, REG_SYS_SERIAL_NUM,
     LEN_STRING_REGISTERS, REG_SYS_TOTAL_POWER_READ, REG_SYS_TOTAL_CURRENT_L1,
     REG_SYS_TOTAL_CURRENT_L2, REG_SYS_TOTAL_CURRENT_L3, REG_SYS_UNUSED_POWER,
-    ADDR_LP1_BASE, ADDR_LP2_BASE,
+    POINT_BASE_ADDRESSES,
     OFFSET_MAX_POWER, OFFSET_STATUS_WORD, OFFSET_POWER, OFFSET_CURRENT_L1,
     OFFSET_CURRENT_L2, OFFSET_CURRENT_L3, OFFSET_CHARGING_TIME, OFFSET_ENERGY,
     OFFSET_PHASE_SWITCHES, OFFSET_ERROR_CODE, OFFSET_STATUS_CODE,
     OFFSET_VOLTAGE_L1, OFFSET_VOLTAGE_L2, OFFSET_VOLTAGE_L3,
-    OFFSET_PHASE_MODE, OFFSET_RFID_TAG, OFFSET_DERATING_STATUS,
+    OFFSET_PHASE_MODE, OFFSET_RFID_TAG, OFFSET_DERATING_STATUS, LEN_RFID_REGISTERS,
+    LEN_POINT_INPUT_BLOCK, LEN_POINT_INPUT_HEAD, LEN_POINT_INPUT_TAIL, LEN_POINT_WIDE_BLOCK,
     # Logic Constants
     MODE_FAST, MODE_LIMITED, MODE_SOLAR, MODE_DISABLED,
     DEFAULT_FAST_POWER, DEFAULT_LIMITED_POWER, DEFAULT_SOLAR_BUFFER,
@@ -38,24 +49,143 @@ PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.NUMBER, Platform.SELECT,
 
 _LOGGER = logging.getLogger(__name__)
 
+# Read once, these never change while the integration is running
+_STATIC_KEYS = ("firmware_version", "article_number", "serial_number")
+# Identification strings (data key, register), adjacent in 0x0020..0x003F
+_IDENT_STRINGS = (
+    ("article_number", REG_SYS_ARTICLE_NUM),
+    ("serial_number", REG_SYS_SERIAL_NUM),
+)
+_LEN_IDENT_STRINGS = REG_SYS_SERIAL_NUM + LEN_STRING_REGISTERS - REG_SYS_ARTICLE_NUM
+# Holding registers (data key, register/offset), refreshed on the slow tier
+_SYSTEM_HOLDING = (
+    ("power_setpoint_abs", REG_SYS_POWER_LIMIT),
+    ("max_schieflast", REG_SYS_MAX_SCHIEFLAST),
+    ("fallback_power", REG_SYS_FALLBACK_POWER),
+)
+# All system holdings lie in 0x0000..0x0003 and are read as one block
+_SYS_HOLDING_START = min(reg for _key, reg in _SYSTEM_HOLDING)
+_LEN_SYS_HOLDING = max(reg for _key, reg in _SYSTEM_HOLDING) - _SYS_HOLDING_START + 1
+_POINT_HOLDING = (
+    ("max_power_limit", OFFSET_MAX_POWER),
+    ("phase_mode", OFFSET_PHASE_MODE),
+)
+# (data key, index within the read block, scale) for the polled input blocks.
+# Tenth-unit registers keep their raw integer; entities scale on render.
+_SYSTEM_TOTALS_MAP = (
+    ("total_power", 0, 100),
+    ("total_current_l1", REG_SYS_TOTAL_CURRENT_L1 - REG_SYS_TOTAL_POWER_READ, 1),
+    ("total_current_l2", REG_SYS_TOTAL_CURRENT_L2 - REG_SYS_TOTAL_POWER_READ, 1),
+    ("total_current_l3", REG_SYS_TOTAL_CURRENT_L3 - REG_SYS_TOTAL_POWER_READ, 1),
+    ("unused_power", REG_SYS_UNUSED_POWER - REG_SYS_TOTAL_POWER_READ, 100),
+)
+_LEN_SYSTEM_TOTALS = REG_SYS_UNUSED_POWER - REG_SYS_TOTAL_POWER_READ + 1
+# Firmware, point count and totals form one input range (0x0006..0x000D)
+_LEN_SYSTEM_INPUT = REG_SYS_UNUSED_POWER - REG_SYS_FW_PATCH + 1
+_IDX_NUM_POINTS = REG_SYS_NUM_POINTS - REG_SYS_FW_PATCH
+_IDX_TOTALS = REG_SYS_TOTAL_POWER_READ - REG_SYS_FW_PATCH
+_POINT_BLOCK_MAP = (
+    ("status_word", 0, 1),
+    ("current_power", OFFSET_POWER - OFFSET_STATUS_WORD, 100),
+    ("current_l1", OFFSET_CURRENT_L1 - OFFSET_STATUS_WORD, 1),
+    ("current_l2", OFFSET_CURRENT_L2 - OFFSET_STATUS_WORD, 1),
+    ("current_l3", OFFSET_CURRENT_L3 - OFFSET_STATUS_WORD, 1),
+    ("energy_session", OFFSET_ENERGY - OFFSET_STATUS_WORD, 1),
+    ("phase_switch_count", OFFSET_PHASE_SWITCHES - OFFSET_STATUS_WORD, 1),
+    ("error_code", OFFSET_ERROR_CODE - OFFSET_STATUS_WORD, 1),
+    ("status_code", OFFSET_STATUS_CODE - OFFSET_STATUS_WORD, 1),
+    ("voltage_l1", OFFSET_VOLTAGE_L1 - OFFSET_STATUS_WORD, 1),
+    ("voltage_l2", OFFSET_VOLTAGE_L2 - OFFSET_STATUS_WORD, 1),
+    ("voltage_l3", OFFSET_VOLTAGE_L3 - OFFSET_STATUS_WORD, 1),
+)
+_IDX_CHARGING_TIME = OFFSET_CHARGING_TIME - OFFSET_STATUS_WORD
+_IDX_RFID_TAG = OFFSET_RFID_TAG - OFFSET_STATUS_WORD
+_IDX_DERATING_STATUS = OFFSET_DERATING_STATUS - OFFSET_STATUS_WORD
+# Pull all mapped registers of a block in one C-level call
+_SYSTEM_TOTALS_VALUES = itemgetter(*(idx for _key, idx, _scale in _SYSTEM_TOTALS_MAP))
+_POINT_BLOCK_VALUES = itemgetter(*(idx for _key, idx, _scale in _POINT_BLOCK_MAP))
+# Precompiled big-endian word formats for the fixed-length string fields
+_STRING_STRUCTS = {n: struct.Struct(f">{n}H") for n in (LEN_RFID_REGISTERS, LEN_STRING_REGISTERS)}
+
+# Returned to block probes when the box rejects the range, so they can tell
+# "not supported" apart from a lost or late reply
+_REJECTED = object()
+# IllegalFunction and IllegalDataAddress. Other exception codes (busy,
+# gateway path unavailable / target not responding) are transient.
+_UNSUPPORTED_CODES = (0x01, 0x02)
+
+def _ok(rr, count: int) -> list[int] | None:
+    """Return the registers of a complete, non-error response, else None."""
+    if rr is None or rr.isError() or len(rr.registers) < count:
+        return None
+    return rr.registers
+
+async def _shielded(coro):
+    """Await a Modbus request that a cancellation cannot abort mid-flight."""
+    # On cancellation only the caller stops waiting; the request still ends
+    # by the client's own timeout. Its late outcome is fetched so an
+    # abandoned failure is not logged as never retrieved.
+    task = asyncio.ensure_future(coro)
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+    return await asyncio.shield(task)
+
+def _decode_firmware(regs) -> str:
+    """Format the two firmware registers as major.minor.patch."""
+    return f"{regs[1]>>8}.{regs[1]&0xFF}.{regs[0]>>8}"
+
+def _decode_block(block_map, getter, regs) -> dict:
+    """Build the data dict for a register block from its mapping table."""
+    return {
+        key: val * scale if scale != 1 else val
+        for (key, _idx, scale), val in zip(block_map, getter(regs))
+    }
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     host = entry.data[CONF_HOST]
     port = entry.data[CONF_PORT]
     name = entry.data.get(CONF_NAME, "Compleo Wallbox")
-    coordinator = CompleoDataUpdateCoordinator(hass, host, port, name)
+    message_wait = entry.options.get(CONF_MESSAGE_WAIT, DEFAULT_MESSAGE_WAIT) / 1000
+    coordinator = CompleoDataUpdateCoordinator(
+        hass, host, port, name, message_wait, entry.data.get(CONF_NUM_POINTS)
+    )
+    # Open the connection once; the keepalive task re-opens it if it drops
+    try:
+        await coordinator.client.connect()
+    except Exception as e:
+        _LOGGER.warning("Initial connect failed: %s", e)
+    coordinator.keepalive_task = hass.async_create_background_task(
+        coordinator.async_keepalive(), name=f"{DOMAIN}_keepalive_{host}"
+    )
+    # Closes the socket and stops reconnecting on unload and also if the
+    # setup below fails
+    entry.async_on_unload(coordinator.async_close)
     try:
         await coordinator.async_config_entry_first_refresh()
     except Exception as e:
         _LOGGER.warning("Initial fetch failed: %s", e)
+    # Remember the point count so restarts skip its probe. Done before the
+    # update listener is added, which would otherwise reload the entry.
+    num_points = coordinator.detected_num_points
+    if num_points and num_points != entry.data.get(CONF_NUM_POINTS):
+        hass.config_entries.async_update_entry(entry, data={**entry.data, CONF_NUM_POINTS: num_points})
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    # Polling already pauses while no entity listens; on shutdown also drop
+    # the socket, the keepalive task and any pending pymodbus reconnect
+    # instead of waiting for the unload.
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, coordinator.async_close)
+    )
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry so changed options take effect."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
-        if coordinator.client.connected:
-            coordinator.client.close()
+        hass.data[DOMAIN].pop(entry.entry_id)
     return unload_ok
 
 class CompleoSmartChargingController:
@@ -153,7 +283,7 @@ class CompleoSmartChargingController:
                  state["stable_target"] = target_power
                  state["last_change_ts"] = now
         
-        base_addr = ADDR_LP1_BASE if index == 1 else ADDR_LP2_BASE
+        base_addr = POINT_BASE_ADDRESSES.get(index)
         if base_addr is None: return
 
         val_to_write = int(target_power / 100)
@@ -166,12 +296,60 @@ class CompleoSmartChargingController:
 class CompleoDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching and controlling Compleo Wallbox data."""
 
-    def __init__(self, hass: HomeAssistant, host: str, port: int, name: str) -> None:
+    # Everything here runs on the event loop. Register decoding stays inline
+    # (a struct.pack of a few registers takes microseconds); anything blocking
+    # or heavy, e.g. file or JSON exports of readings, must go through
+    # hass.async_add_executor_job.
+
+    def __init__(
+        self, hass: HomeAssistant, host: str, port: int, name: str,
+        message_wait: float = 0.0, num_points: int | None = None,
+    ) -> None:
         self.host = host
-        self.client = AsyncModbusTcpClient(host, port=port, timeout=5)
+        self.client = AsyncModbusTcpClient(
+            host, port=port, timeout=READ_TIMEOUT, retries=0,
+            reconnect_delay=RECONNECT_DELAY, reconnect_delay_max=RECONNECT_DELAY_MAX,
+        )
         self.device_name = name
-        self.device_info_map = {} 
-        self._strategy_name = None
+        # Shared by the system entities; only model/firmware are filled in later
+        self.device_info_map = {
+            "identifiers": {(DOMAIN, host)},
+            "name": name,
+            "manufacturer": "Compleo",
+            "model": "Compleo Wallbox",
+            "sw_version": None,
+        }
+        # The slave/unit keyword depends on the installed pymodbus version;
+        # it cannot change at runtime, so resolve it once.
+        params = inspect.signature(self.client.read_input_registers).parameters
+        self._slave_kw = next((kw for kw in ("slave", "device_id", "unit") if kw in params), None)
+        self.keepalive_task = None
+        # Bounds the reads a gathered update has in flight at once
+        self._read_sem = asyncio.Semaphore(MAX_CONCURRENT_READS)
+        # Optional spacing between request starts for slow gateways (seconds)
+        self._message_wait = message_wait
+        self._next_tx_ts = 0.0
+        self._static = {}
+        if num_points: self._static["num_points"] = num_points
+        self._string_fc = {}
+        # None until the box answers or rejects the 26-register point block;
+        # False (after IllegalFunction/IllegalDataAddress) keeps the separate
+        # reads.
+        self._wide_point_block = None
+        # Same for the system holding block, which spans unused 0x0001
+        self._system_holding_block = None
+        # Set once the box rejects the 15-register block over 0x009 as an
+        # unsupported range
+        self._split_point_input = False
+        self._holding = {}
+        self._holding_dirty = True
+        self._last_holding_poll = 0.0
+        self._firmware_read_ts = 0.0
+        self._consecutive_failures = 0
+        # Regular polling interval in seconds, unaffected by failure retries
+        self._poll_interval = DEFAULT_SCAN_INTERVAL
+        # Failed reads in a row per section ("totals" or a point index)
+        self._section_failures = {}
         
         self.logic = CompleoSmartChargingController(self)
         
@@ -180,172 +358,438 @@ class CompleoDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name=f"{DOMAIN}_{host}",
             update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            # An idle box returns the same snapshot most polls; only notify
+            # the entities when something actually changed.
+            always_update=False,
         )
         
         self.data = {
-            "system": {"num_points": 1},
+            "system": {"num_points": num_points or 1},
             "points": {}
         }
 
     async def _async_update_data(self):
+        # One deadline for all (gathered) reads, so a stalled update cannot
+        # push into the next scan interval. Based on the regular interval: a
+        # short retry interval must not starve the retry.
+        budget = min(self._poll_interval - 1, UPDATE_TIMEOUT)
         try:
-            new_data = await self._fetch_wallbox_data()
+            async with asyncio.timeout(budget):
+                new_data = await self._fetch_wallbox_data()
+            # The control writes run outside the deadline so it can never
+            # cancel a setpoint write mid-flight; each one is bounded by the
+            # client's response timeout instead.
             num_points = new_data["system"].get("num_points", 1)
             for i in range(1, num_points + 1):
                 self.logic.init_point(i)
                 await self.logic.run_logic(i)
+            # Applied after the logic ran so its writes show up immediately
+            self._apply_holding_registers(new_data)
+            self._adapt_update_interval(new_data)
+            self._consecutive_failures = 0
             return new_data
 
-        except Exception as err:
-            _LOGGER.error("Error updating/controlling Compleo: %s", err)
-            raise UpdateFailed(f"Communication error: {err}")
+        except TimeoutError:
+            return self._fallback_or_raise(f"Modbus update exceeded {budget:.0f} s")
+        # Only transport problems count as a failed poll; anything else is
+        # a bug and propagates with its traceback.
+        except (UpdateFailed, ModbusException, OSError) as err:
+            return self._fallback_or_raise(f"Communication error: {err}")
+
+    def _fallback_or_raise(self, reason):
+        """Keep the last good data through a few failed updates, then fail."""
+        self._consecutive_failures += 1
+        # A single dropped poll is retried quickly; after that back off while
+        # the wallbox stays unreachable. The next good update restores the
+        # adaptive interval.
+        if self._consecutive_failures == 1:
+            retry = QUICK_RETRY_INTERVAL
+        else:
+            retry = min(IDLE_SCAN_INTERVAL * 1.5 ** (self._consecutive_failures - 2), MAX_RETRY_INTERVAL)
+        self.update_interval = timedelta(seconds=retry)
+        # The coordinator itself logs the UpdateFailed once and the recovery
+        if self._consecutive_failures > MAX_CONSECUTIVE_FAILURES or not self.data["points"]:
+            raise UpdateFailed(reason)
+        _LOGGER.debug(
+            "Error updating/controlling Compleo: %s; keeping last data (%d/%d)",
+            reason, self._consecutive_failures, MAX_CONSECUTIVE_FAILURES,
+        )
+        return self.data
+
+    def _keep_stale(self, section) -> bool:
+        """Count a failed read of section; True while its old values may be served."""
+        failures = self._section_failures.get(section, 0) + 1
+        self._section_failures[section] = failures
+        return failures <= MAX_CONSECUTIVE_FAILURES
+
+    @property
+    def detected_num_points(self) -> int | None:
+        """Point count read from the wallbox, None until known."""
+        return self._static.get("num_points")
+
+    def _adapt_update_interval(self, data):
+        """Poll fast while any point charges or is controlled, slowly otherwise."""
+        charging = any(pd.get("current_power", 0) > 0 for pd in data["points"].values())
+        # Solar and zoe control run once per update and must follow surplus
+        # and phase changes even before (or between) charging sessions.
+        controlled = any(
+            state["mode"] == MODE_SOLAR or state["zoe_mode"] for state in self.logic.points_state.values()
+        )
+        seconds = ACTIVE_SCAN_INTERVAL if charging or controlled else IDLE_SCAN_INTERVAL
+        self._poll_interval = seconds
+        if self.update_interval.total_seconds() != seconds:
+            _LOGGER.debug("Switching update interval to %s s", seconds)
+            self.update_interval = timedelta(seconds=seconds)
 
     async def _fetch_wallbox_data(self):
         new_data = {"system": {}, "points": {}}
         
-        num_points = 1
-        rr = await self._read_registers_safe("read_input_registers", REG_SYS_NUM_POINTS, 1)
-        if rr and not (hasattr(rr, 'isError') and rr.isError()) and len(rr.registers) > 0:
-            val = rr.registers[0]
-            if val in [1, 2]: num_points = val
+        # The point count is fixed by the hardware: once read it is cached
+        # (and kept across reconnects), so LP2 is never polled on a
+        # single-point box and the count is not re-read every scan.
+        num_points = self._static.get("num_points")
+        regs_totals = None
+        if num_points is None:
+            # Until then the count is fetched together with the firmware
+            # and totals, which share its contiguous input range.
+            num_points = 1
+            regs = await self._read_registers_safe("read_input_registers", REG_SYS_FW_PATCH, _LEN_SYSTEM_INPUT)
+            if regs:
+                self._static["firmware_version"] = _decode_firmware(regs)
+                self._firmware_read_ts = time.monotonic()
+                if regs[_IDX_NUM_POINTS] in [1, 2]: num_points = self._static["num_points"] = regs[_IDX_NUM_POINTS]
+                regs_totals = regs[_IDX_TOTALS:]
         new_data["system"]["num_points"] = num_points
 
-        rr = await self._read_registers_safe("read_holding_registers", REG_SYS_POWER_LIMIT, 1)
-        if rr and hasattr(rr, 'registers') and len(rr.registers)>0: new_data["system"]["power_setpoint_abs"] = rr.registers[0]
-        
-        rr = await self._read_registers_safe("read_holding_registers", REG_SYS_MAX_SCHIEFLAST, 1)
-        if rr and hasattr(rr, 'registers') and len(rr.registers)>0: new_data["system"]["max_schieflast"] = rr.registers[0]
-        
-        rr = await self._read_registers_safe("read_holding_registers", REG_SYS_FALLBACK_POWER, 1)
-        if rr and hasattr(rr, 'registers') and len(rr.registers)>0: new_data["system"]["fallback_power"] = rr.registers[0]
-
-        rr = await self._read_registers_safe("read_input_registers", REG_SYS_FW_PATCH, 2)
-        if rr and hasattr(rr, 'registers') and len(rr.registers)>=2:
-            new_data["system"]["firmware_version"] = f"{rr.registers[1]>>8}.{rr.registers[1]&0xFF}.{rr.registers[0]>>8}"
-
-        rr = await self._read_registers_safe("read_input_registers", REG_SYS_TOTAL_POWER_READ, 5)
-        if rr and hasattr(rr, 'registers') and len(rr.registers)>=5:
-            new_data["system"]["total_power"] = rr.registers[0] * 100
-            new_data["system"]["total_current_l1"] = rr.registers[1] * 0.1
-            new_data["system"]["total_current_l2"] = rr.registers[2] * 0.1
-            new_data["system"]["total_current_l3"] = rr.registers[3] * 0.1
-            new_data["system"]["unused_power"] = rr.registers[4] * 100
-
-        art = await self._read_string(REG_SYS_ARTICLE_NUM, LEN_STRING_REGISTERS)
-        if art: new_data["system"]["article_number"] = art
-        ser = await self._read_string(REG_SYS_SERIAL_NUM, LEN_STRING_REGISTERS)
-        if ser: new_data["system"]["serial_number"] = ser
-
-        sum_sess = 0.0
+        # Holding registers only change when written (by us or an external
+        # EMS), so they are re-read on a slow cadence or after a write.
+        now = time.monotonic()
+        poll_holding = self._holding_dirty or now - self._last_holding_poll >= SLOW_SCAN_INTERVAL
+
+        # The remaining reads are independent of each other, so issue them
+        # concurrently; total latency becomes roughly the slowest read.
+        tasks = [self._read_charging_point_data(i) for i in range(1, num_points + 1)]
+        read_totals = regs_totals is None
+        if read_totals:
+            tasks.append(self._read_registers_safe("read_input_registers", REG_SYS_TOTAL_POWER_READ, _LEN_SYSTEM_TOTALS))
+        holding_start = len(tasks)
+        if poll_holding:
+            tasks.append(self._read_system_holding())
+            tasks.extend(self._read_point_holding(i) for i in range(1, num_points + 1))
+        holding_end = len(tasks)
+        refresh_firmware = now - self._firmware_read_ts >= FIRMWARE_REFRESH_INTERVAL
+        if refresh_firmware or any(key not in self._static for key in _STATIC_KEYS):
+            tasks.append(self._read_static_info(refresh_firmware))
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Transport errors already came back as None (section kept below) or
+        # UpdateFailed (link lost); anything else is a bug and propagates.
+        for res in results:
+            if isinstance(res, BaseException): raise res
+        points = results[:num_points]
+        if read_totals: regs_totals = results[num_points]
+
+        # Only a complete holding refresh verifies written setpoints; any
+        # failed block keeps them due on the next poll.
+        if poll_holding and all(results[holding_start:holding_end]):
+            self._holding_dirty = False
+            self._last_holding_poll = now
+
+        # A block that failed to read keeps its last good values for a few
+        # polls, then drops them; the update only fails when nothing fresh
+        # came back at all.
+        old_data = self.data
         found = False
-        for i in range(1, num_points + 1):
-            pd = await self._read_charging_point_data(i)
+        if regs_totals:
+            new_data["system"].update(_decode_block(_SYSTEM_TOTALS_MAP, _SYSTEM_TOTALS_VALUES, regs_totals))
+            self._section_failures.pop("totals", None)
+            found = True
+        elif self._keep_stale("totals"):
+            new_data["system"].update(
+                (key, old_data["system"][key]) for key, _idx, _scale in _SYSTEM_TOTALS_MAP if key in old_data["system"]
+            )
+
+        new_data["system"].update(self._static)
+
+        for i, pd in enumerate(points, start=1):
             if pd:
-                new_data["points"][i] = pd
-                sum_sess += pd.get("energy_session", 0)
+                self._section_failures.pop(i, None)
                 found = True
+            elif self._keep_stale(i) and (pd := old_data["points"].get(i)):
+                # Copied, so merging holdings cannot alter the old snapshot
+                pd = dict(pd)
+            else:
+                continue
+            new_data["points"][i] = pd
         
-        new_data["system"]["total_energy_session"] = sum_sess
+        new_data["system"]["total_energy_session"] = sum(
+            pd.get("energy_session", 0) for pd in new_data["points"].values()
+        )
         # Note: total_energy_total (Lifetime) removed from coordinator calc as we now use virtual sensors
         
-        if not found and not new_data["system"]: raise UpdateFailed("No data")
+        if not found: raise UpdateFailed("No data")
         return new_data
 
-    async def _read_registers_safe(self, func_name, address, count, slave_id=1):
-        if not self.client.connected:
-            await self.client.connect()
-            await asyncio.sleep(0.2)
-        func = getattr(self.client, func_name)
-        strategies = [
-            ("slave_pos_cnt", [address, count], {"slave": slave_id}),
-            ("unit_pos_cnt", [address, count], {"unit": slave_id}),
-            ("no_unit_pos_cnt", [address, count], {}),
-            ("slave_kw_cnt", [address], {"count": count, "slave": slave_id}),
-            ("unit_kw_cnt", [address], {"count": count, "unit": slave_id}),
-            ("no_unit_kw_cnt", [address], {"count": count})
-        ]
-        if self._strategy_name:
-             for i, (name, _, _) in enumerate(strategies):
-                 if name == self._strategy_name:
-                     strategies.insert(0, strategies.pop(i))
-                     break
-        for name, args, kwargs in strategies:
+    @callback
+    def async_close(self, _event=None) -> None:
+        """Stop the keepalive task and close the Modbus connection."""
+        if self.keepalive_task:
+            self.keepalive_task.cancel()
+            self.keepalive_task = None
+        # Also while disconnected: close() cancels pymodbus's own reconnect
+        # task, which would otherwise keep dialling the wallbox.
+        self.client.close()
+
+    async def async_keepalive(self):
+        """Re-open the Modbus connection in the background when it dropped."""
+        while True:
+            await asyncio.sleep(KEEPALIVE_INTERVAL)
+            if self.client.connected: continue
+            # Identification is re-read after a reconnect, see _read_registers_safe
+            self._invalidate_identification()
             try:
-                result = await func(*args, **kwargs)
-                if result is None or (hasattr(result, 'isError') and result.isError()):
-                    return result
-                if hasattr(result, 'registers') and len(result.registers) < count:
-                    continue
-                self._strategy_name = name
-                return result
-            except TypeError: continue
-            except Exception: continue
-        return None
+                await self.client.connect()
+            except Exception as err:
+                _LOGGER.debug("Reconnect to %s failed: %s", self.host, err)
+
+    async def _read_static_info(self, refresh_firmware=False):
+        """Read identification registers that do not change at runtime."""
+        if refresh_firmware or "firmware_version" not in self._static:
+            regs = await self._read_registers_safe("read_input_registers", REG_SYS_FW_PATCH, 2)
+            if regs:
+                self._static["firmware_version"] = _decode_firmware(regs)
+                self._firmware_read_ts = time.monotonic()
+        # Both strings missing (first poll or after a reconnect): try them in
+        # one input read, unless they are known to live in holding space.
+        if (
+            all(key not in self._static for key, _reg in _IDENT_STRINGS)
+            and self._string_fc.get(REG_SYS_ARTICLE_NUM) != "read_holding_registers"
+        ):
+            regs = await self._read_registers_safe("read_input_registers", REG_SYS_ARTICLE_NUM, _LEN_IDENT_STRINGS)
+            for key, reg in _IDENT_STRINGS:
+                start = reg - REG_SYS_ARTICLE_NUM
+                if regs and (val := self._decode_registers_to_string(regs[start:start + LEN_STRING_REGISTERS])):
+                    self._static[key] = val
+                    self._string_fc[reg] = "read_input_registers"
+        # Whatever is still missing is probed per string (input, then holding)
+        for key, reg in _IDENT_STRINGS:
+            if key not in self._static and (val := await self._read_string(reg, LEN_STRING_REGISTERS)):
+                self._static[key] = val
+        self._update_device_info()
+
+    def _invalidate_identification(self):
+        """Have the identification be re-read; the fixed point count is kept."""
+        # Dropping num_points would make a failed re-read fall back to one
+        # point and lose LP2 until the count is read again.
+        for key in _STATIC_KEYS: self._static.pop(key, None)
+
+    def _update_device_info(self):
+        """Push a newly read model/firmware to the shared map and registry."""
+        model = self._static.get("article_number", self.device_info_map["model"])
+        # A failed re-read after a reconnect keeps the known values
+        sw_version = self._static.get("firmware_version", self.device_info_map["sw_version"])
+        if model == self.device_info_map["model"] and sw_version == self.device_info_map["sw_version"]:
+            return
+        self.device_info_map["model"] = model
+        self.device_info_map["sw_version"] = sw_version
+        registry = dr.async_get(self.hass)
+        if device := registry.async_get_device(identifiers={(DOMAIN, self.host)}):
+            registry.async_update_device(device.id, model=model, sw_version=sw_version)
+
+    async def _read_system_holding(self) -> bool:
+        """Refresh the cached system holding registers; True if all were read."""
+        if self._system_holding_block is not False:
+            regs = await self._read_registers_safe(
+                "read_holding_registers", _SYS_HOLDING_START, _LEN_SYS_HOLDING, probe=True
+            )
+            # Latched only on a rejected range, like the point block
+            if regs is not _REJECTED:
+                if not regs: return False
+                self._system_holding_block = True
+                for _key, reg in _SYSTEM_HOLDING:
+                    self._holding[reg] = regs[reg - _SYS_HOLDING_START]
+                return True
+            if self._system_holding_block: return False
+            _LOGGER.debug("System holding block not readable, using separate reads")
+            self._system_holding_block = False
+        results = await asyncio.gather(
+            *(self._read_registers_safe("read_holding_registers", reg, 1) for _key, reg in _SYSTEM_HOLDING)
+        )
+        for (_key, reg), regs in zip(_SYSTEM_HOLDING, results):
+            if regs: self._holding[reg] = regs[0]
+        return all(results)
+
+    async def _read_point_holding(self, index) -> bool:
+        """Refresh the cached holding registers of one point."""
+        base = POINT_BASE_ADDRESSES[index]
+        regs = await self._read_registers_safe("read_holding_registers", base + OFFSET_MAX_POWER, 10)
+        if not regs: return False
+        for _key, offset in _POINT_HOLDING:
+            self._holding[base + offset] = regs[offset - OFFSET_MAX_POWER]
+        return True
+
+    def _apply_holding_registers(self, data):
+        """Merge the cached holding register values into a data snapshot."""
+        for key, reg in _SYSTEM_HOLDING:
+            if reg in self._holding: data["system"][key] = self._holding[reg]
+        for index, point in data["points"].items():
+            base = POINT_BASE_ADDRESSES[index]
+            for key, offset in _POINT_HOLDING:
+                if base + offset in self._holding: point[key] = self._holding[base + offset]
+
+    async def _read_registers_safe(
+        self, func_name, address, count, slave_id=1, probe=False
+    ) -> list[int] | object | None:
+        """Read a register range; returns usable registers or None.
+
+        With probe set, a range the box does not support returns _REJECTED.
+        """
+        func = getattr(self.client, func_name)
+        kwargs = {"count": count}
+        if self._slave_kw: kwargs[self._slave_kw] = slave_id
+        try:
+            async with self._read_sem:
+                await self._async_wait_message_gap()
+                # The update deadline only stops waiting for this read
+                result = await _shielded(func(address, **kwargs))
+        except ConnectionException as err:
+            # No link at all: fail the update. The last good data is served
+            # for up to MAX_CONSECUTIVE_FAILURES updates before entities go
+            # unavailable, while the client reconnects in the background with
+            # backoff. The box may be rebooting (e.g. firmware update), so
+            # re-read its identity.
+            self._invalidate_identification()
+            raise UpdateFailed(f"Not connected to {self.host}: {err}") from err
+        except (ModbusException, OSError) as err:
+            # Other transport errors (incl. a response timeout) are left to
+            # the next poll; cancellation and bugs propagate.
+            _LOGGER.debug("Reading 0x%04X failed: %s", address, err)
+            return None
+        # Exception and short responses are dropped here, so callers only
+        # ever index into complete register lists.
+        if (regs := _ok(result, count)) is None:
+            _LOGGER.debug("Reading 0x%04X (%d registers) failed: %s", address, count, result)
+            if probe and getattr(result, "exception_code", None) in _UNSUPPORTED_CODES: return _REJECTED
+        return regs
+
+    async def _async_wait_message_gap(self):
+        """Delay this request until its slot if a message wait is configured."""
+        if not self._message_wait: return
+        now = self.hass.loop.time()
+        slot = max(now, self._next_tx_ts)
+        self._next_tx_ts = slot + self._message_wait
+        if slot > now: await asyncio.sleep(slot - now)
 
     async def async_write_register(self, address, value, slave_id=1):
-        if not self.client.connected:
-            await self.client.connect()
-            await asyncio.sleep(0.1)
-        async def attempt(kwargs_dict): return await self.client.write_register(address, value, **kwargs_dict)
-        attempts = [{"slave": slave_id}, {"unit": slave_id}, {}]
-        for kwargs in attempts:
-            try:
-                res = await attempt(kwargs)
-                if res and not (hasattr(res, 'isError') and res.isError()): return res
-            except TypeError: continue
-            except Exception: continue
-        return None
-
-    def _decode_registers_to_string(self, rr, count) -> str | None:
-        if rr and hasattr(rr, 'registers'):
+        # Same slave keyword as the reads, resolved once in __init__
+        kwargs = {self._slave_kw: slave_id} if self._slave_kw else {}
+        try:
+            await self._async_wait_message_gap()
+            res = await self.client.write_register(address, value, **kwargs)
+        except (ModbusException, OSError) as err:
+            _LOGGER.debug("Writing %s to 0x%04X failed: %s", value, address, err)
+            return None
+        if res is None or res.isError():
+            _LOGGER.debug("Writing %s to 0x%04X returned an error: %s", value, address, res)
+            return None
+        if self._holding.get(address) != value:
+            self._holding[address] = value
+            self._holding_dirty = True
+        return res
+
+    async def async_write_register_and_update(self, address, value):
+        """Write a register for an entity and publish the value without a poll."""
+        # The write marks the holding cache dirty, so the next scheduled
+        # update reads the value back from the wallbox.
+        res = await self.async_write_register(address, value)
+        if res is not None and self.data:
+            self._apply_holding_registers(self.data)
+            self.async_update_listeners()
+        return res
+
+    def _decode_registers_to_string(self, regs) -> str | None:
+        if regs:
             try:
-                s = b""
-                for reg in rr.registers: s += reg.to_bytes(2, 'big')
-                val = s.decode('ascii', errors='ignore').rstrip('\x00').strip()
+                # Modbus registers are big-endian 16-bit words
+                fmt = _STRING_STRUCTS.get(len(regs)) or struct.Struct(f">{len(regs)}H")
+                s = fmt.pack(*regs)
+                # Cut at the first NUL terminator before decoding once
+                val = s.split(b'\x00', 1)[0].decode('ascii', errors='ignore').strip()
                 if val: return val
             except: pass
         return None
 
     async def _read_string(self, address, count, name_debug="Unknown") -> str | None:
-        rr = await self._read_registers_safe("read_input_registers", address, count)
-        val = self._decode_registers_to_string(rr, count)
-        if val: return val
-        rr_hold = await self._read_registers_safe("read_holding_registers", address, count)
-        return self._decode_registers_to_string(rr_hold, count)
+        # Once a string was found in input or holding space, stick to it
+        if func_name := self._string_fc.get(address):
+            regs = await self._read_registers_safe(func_name, address, count)
+            return self._decode_registers_to_string(regs)
+        for func_name in ("read_input_registers", "read_holding_registers"):
+            regs = await self._read_registers_safe(func_name, address, count)
+            if val := self._decode_registers_to_string(regs):
+                self._string_fc[address] = func_name
+                return val
+        return None
 
     async def _read_charging_point_data(self, index: int) -> dict | None:
-        base = ADDR_LP1_BASE if index == 1 else ADDR_LP2_BASE
+        base = POINT_BASE_ADDRESSES.get(index)
         if base is None: return None
         data = {}
+
+        regs, rfid, derating = await self._read_point_input(base)
+
+        if regs:
+             data.update(_decode_block(_POINT_BLOCK_MAP, _POINT_BLOCK_VALUES, regs))
+             data["charging_time"] = regs[_IDX_CHARGING_TIME] + (regs[_IDX_CHARGING_TIME + 1] << 16)
         
-        rr = await self._read_registers_safe("read_holding_registers", base + OFFSET_MAX_POWER, 10)
-        if rr and len(rr.registers)>=10:
-             data["max_power_limit"] = rr.registers[0]
-             data["phase_mode"] = rr.registers[9]
-
-        rr = await self._read_registers_safe("read_input_registers", base + OFFSET_STATUS_WORD, 8)
-        if rr and len(rr.registers)>=8:
-             data["status_word"] = rr.registers[0]
-             data["current_power"] = rr.registers[1] * 100
-             data["current_l1"] = rr.registers[2] * 0.1
-             data["current_l2"] = rr.registers[3] * 0.1
-             data["current_l3"] = rr.registers[4] * 0.1
-             data["charging_time"] = rr.registers[5] + (rr.registers[6] << 16)
-             data["energy_session"] = rr.registers[7] * 0.1
-
-        rr = await self._read_registers_safe("read_input_registers", base + OFFSET_PHASE_SWITCHES, 6)
-        if rr and len(rr.registers)>=6:
-             data["phase_switch_count"] = rr.registers[0]
-             data["error_code"] = rr.registers[1]
-             data["status_code"] = rr.registers[2]
-             data["voltage_l1"] = rr.registers[3]
-             data["voltage_l2"] = rr.registers[4]
-             data["voltage_l3"] = rr.registers[5]
-        
-        rfid = await self._read_string(base + OFFSET_RFID_TAG, 10)
         if rfid: data["rfid_tag"] = rfid
         
-        rr = await self._read_registers_safe("read_input_registers", base + OFFSET_DERATING_STATUS, 1)
-        if rr and len(rr.registers)>0: data["derating_status"] = rr.registers[0]
-
-        return data
\ No newline at end of file
+        if derating is not None: data["derating_status"] = derating
+
+        return data
+
+    async def _read_point_input(self, base):
+        """Read a point's input block, RFID tag and derating status."""
+        if self._wide_point_block is not False:
+            # Status word through derating status in one request; the RFID
+            # tag is decoded from its slice of the block.
+            regs = await self._read_registers_safe(
+                "read_input_registers", base + OFFSET_STATUS_WORD, LEN_POINT_WIDE_BLOCK, probe=True
+            )
+            # Only a rejected range proves the block unsupported; any other
+            # failure is retried with the block on the next poll.
+            if regs is not _REJECTED:
+                if not regs: return None, None, None
+                self._wide_point_block = True
+                rfid = self._decode_registers_to_string(regs[_IDX_RFID_TAG:_IDX_RFID_TAG + LEN_RFID_REGISTERS])
+                return regs, rfid, regs[_IDX_DERATING_STATUS]
+            if self._wide_point_block: return None, None, None
+            _LOGGER.debug("Wide point block not readable, using separate reads")
+            self._wide_point_block = False
+
+        regs, rfid, regs_derating = await asyncio.gather(
+            self._read_point_status(base),
+            self._read_string(base + OFFSET_RFID_TAG, LEN_RFID_REGISTERS),
+            self._read_registers_safe("read_input_registers", base + OFFSET_DERATING_STATUS, 1),
+        )
+        return regs, rfid, regs_derating[0] if regs_derating else None
+
+    async def _read_point_status(self, base):
+        """Read status word through voltage L3 of a point."""
+        if not self._split_point_input:
+            # One contiguous range; the holding-only phase mode register in
+            # between is read as a filler.
+            regs = await self._read_registers_safe(
+                "read_input_registers", base + OFFSET_STATUS_WORD, LEN_POINT_INPUT_BLOCK, probe=True
+            )
+            # A busy or lost reply is retried with the block on the next poll
+            if regs is not _REJECTED: return regs
+            _LOGGER.debug("Point input block rejected, reading around register 0x009")
+            self._split_point_input = True
+        head, tail = await asyncio.gather(
+            self._read_registers_safe("read_input_registers", base + OFFSET_STATUS_WORD, LEN_POINT_INPUT_HEAD),
+            self._read_registers_safe("read_input_registers", base + OFFSET_PHASE_SWITCHES, LEN_POINT_INPUT_TAIL),
+        )
+        if not (head and tail): return None
+        # Pad the phase mode slot so the block layout stays the same
+        return [*head, 0, *tail]
\ No newline at end of file
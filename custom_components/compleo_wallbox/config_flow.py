@@ -11,9 +11,10 @@ from pymodbus.client import AsyncModbusTcpClient
 from homeassistant import config_entries
 from homeassistant.components import zeroconf
 from homeassistant.const import CONF_HOST, CONF_PORT, CONF_NAME
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult, AbortFlow
 
-from .const import DOMAIN, DEFAULT_PORT, DEFAULT_NAME
+from .const import DOMAIN, DEFAULT_PORT, DEFAULT_NAME, CONF_MESSAGE_WAIT, DEFAULT_MESSAGE_WAIT
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,6 +27,14 @@ class CompleoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Initialize the config flow."""
         self._discovery_info: dict[str, Any] = {}
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> CompleoOptionsFlow:
+        """Get the options flow for this handler."""
+        return CompleoOptionsFlow(config_entry)
+
     async def async_step_zeroconf(
         self, discovery_info: zeroconf.ZeroconfServiceInfo
     ) -> FlowResult:
@@ -124,4 +133,29 @@ class CompleoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 vol.Required(CONF_PORT, default=DEFAULT_PORT): int,
             }),
             errors=errors
-        )
\ No newline at end of file
+        )
+
+
+class CompleoOptionsFlow(config_entries.OptionsFlow):
+    """Handle Compleo Wallbox options."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the Modbus timing options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema({
+                vol.Required(
+                    CONF_MESSAGE_WAIT,
+                    default=self._entry.options.get(CONF_MESSAGE_WAIT, DEFAULT_MESSAGE_WAIT),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=1000)),
+            }),
+        )
@@ -2,9 +2,42 @@
 
 DOMAIN = "compleo_wallbox"
 DEFAULT_SCAN_INTERVAL = 30
+# Adaptive polling: fast while a point draws power, slow while all are idle
+ACTIVE_SCAN_INTERVAL = 10
+IDLE_SCAN_INTERVAL = 60
+# A first failed update is retried after this short delay (seconds)
+QUICK_RETRY_INTERVAL = 5
+# Further failed updates stretch the idle interval by 1.5x each, up to this cap
+MAX_RETRY_INTERVAL = 300
+# Failed updates in a row that still serve the last good data
+MAX_CONSECUTIVE_FAILURES = 3
+# Per-request response timeout (seconds); a lost reply is not retried
+# because the next poll re-reads everything anyway
+READ_TIMEOUT = 2
+# Upper bound for the reads of a whole update, in seconds
+UPDATE_TIMEOUT = 15
+# Holding registers (setpoints) are re-read at this interval or after a write
+SLOW_SCAN_INTERVAL = 300
+# Firmware version is re-checked this often; pymodbus may reconnect to a
+# freshly updated wallbox without the coordinator seeing the outage
+FIRMWARE_REFRESH_INTERVAL = 3600
+# Background check that re-opens a dropped Modbus connection
+KEEPALIVE_INTERVAL = 60
+# Outstanding Modbus reads per update (many wallboxes handle only a few)
+MAX_CONCURRENT_READS = 4
+# pymodbus reconnect backoff (seconds), doubled per failed attempt
+RECONNECT_DELAY = 1
+RECONNECT_DELAY_MAX = 60
 DEFAULT_PORT = 502
 DEFAULT_NAME = "Compleo Wallbox"
 
+# Options
+CONF_MESSAGE_WAIT = "message_wait_milliseconds"
+DEFAULT_MESSAGE_WAIT = 0
+
+# Entry data filled in after the first successful detection
+CONF_NUM_POINTS = "num_points"
+
 # --- REGISTER KONFIGURATION ---
 REG_SYS_POWER_LIMIT = 0x0000
 REG_SYS_MAX_SCHIEFLAST = 0x0002
@@ -24,6 +57,8 @@ LEN_STRING_REGISTERS = 16
 
 ADDR_LP1_BASE = 0x0100
 ADDR_LP2_BASE = 0x0200
+# Register base per charging point index; a further point is one entry
+POINT_BASE_ADDRESSES = {1: ADDR_LP1_BASE, 2: ADDR_LP2_BASE}
 
 OFFSET_MAX_POWER = 0x0000
 OFFSET_STATUS_WORD = 0x001
@@ -41,9 +76,26 @@ OFFSET_VOLTAGE_L1 = 0x00D
 OFFSET_VOLTAGE_L2 = 0x00E
 OFFSET_VOLTAGE_L3 = 0x00F
 OFFSET_RFID_TAG = 0x010
+LEN_RFID_REGISTERS = 10
 # OFFSET_METER_READING (0x018) entfernt, da nicht funktionsfähig
 OFFSET_DERATING_STATUS = 0x01A
 
+# Status word .. voltage L3 read as one block (0x009 is a holding-only filler)
+LEN_POINT_INPUT_BLOCK = OFFSET_VOLTAGE_L3 - OFFSET_STATUS_WORD + 1
+# The two input ranges around 0x009, for boxes that reject the filler
+LEN_POINT_INPUT_HEAD = OFFSET_ENERGY - OFFSET_STATUS_WORD + 1
+LEN_POINT_INPUT_TAIL = OFFSET_VOLTAGE_L3 - OFFSET_PHASE_SWITCHES + 1
+# Same block extended over RFID tag and derating status (26 registers)
+LEN_POINT_WIDE_BLOCK = OFFSET_DERATING_STATUS - OFFSET_STATUS_WORD + 1
+
+# Values the wallbox reports in tenths (A, kWh). The coordinator keeps the
+# raw register integer and entities divide by 10 when rendering.
+TENTHS_VALUE_KEYS = {
+    "current_l1", "current_l2", "current_l3", "energy_session",
+    "total_current_l1", "total_current_l2", "total_current_l3",
+    "total_energy_session",
+}
+
 # --- STATUS MAPPINGS (Keys for Translation) ---
 CHARGE_POINT_ERROR_CODES = {
     0: "no_error",
@@ -11,7 +11,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN, REG_SYS_POWER_LIMIT, REG_SYS_MAX_SCHIEFLAST, REG_SYS_FALLBACK_POWER,
-    ADDR_LP1_BASE, ADDR_LP2_BASE, OFFSET_MAX_POWER
+    POINT_BASE_ADDRESSES, OFFSET_MAX_POWER
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -66,8 +66,7 @@ class CompleoNumber(CoordinatorEntity, NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         modbus_val = int(value / self._multiplier)
-        await self.coordinator.async_write_register(self._register, modbus_val)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write_register_and_update(self._register, modbus_val)
 
 class CompleoPointNumber(CoordinatorEntity, NumberEntity):
     _attr_has_entity_name = True
@@ -76,7 +75,7 @@ class CompleoPointNumber(CoordinatorEntity, NumberEntity):
         self._point_index = point_index
         self._key = key
         self._attr_translation_key = key
-        base = ADDR_LP1_BASE if point_index == 1 else ADDR_LP2_BASE
+        base = POINT_BASE_ADDRESSES[point_index]
         self._register = base + offset
         self._attr_native_unit_of_measurement = unit
         self._attr_device_class = dev_class
@@ -99,8 +98,7 @@ class CompleoPointNumber(CoordinatorEntity, NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         modbus_val = int(value / self._multiplier)
-        await self.coordinator.async_write_register(self._register, modbus_val)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write_register_and_update(self._register, modbus_val)
 
 class CompleoVirtualNumber(CoordinatorEntity, NumberEntity):
     _attr_has_entity_name = True
@@ -9,7 +9,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
-    DOMAIN, ADDR_LP1_BASE, ADDR_LP2_BASE, OFFSET_PHASE_MODE,
+    DOMAIN, POINT_BASE_ADDRESSES, OFFSET_PHASE_MODE,
     CHARGING_MODES
 )
 
@@ -52,7 +52,7 @@ class CompleoPhaseMode(CoordinatorEntity, SelectEntity):
         super().__init__(coordinator)
         self._point_index = point_index
         self._attr_unique_id = f"{uid_prefix}_lp{point_index}_phase_mode"
-        base = ADDR_LP1_BASE if point_index == 1 else ADDR_LP2_BASE
+        base = POINT_BASE_ADDRESSES[point_index]
         self._register = base + OFFSET_PHASE_MODE
 
     @property
@@ -73,8 +73,7 @@ class CompleoPhaseMode(CoordinatorEntity, SelectEntity):
     async def async_select_option(self, option: str) -> None:
         value = PHASE_MODE_KEYS_TO_VALUE.get(option)
         if value is None: return
-        await self.coordinator.async_write_register(self._register, value)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write_register_and_update(self._register, value)
 
 class CompleoChargingMode(CoordinatorEntity, SelectEntity):
     """Virtual Smart Charging Mode Selector."""
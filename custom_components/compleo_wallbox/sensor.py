@@ -19,7 +19,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, CHARGE_POINT_ERROR_CODES, DERATING_STATUS_MAP
+from .const import DOMAIN, CHARGE_POINT_ERROR_CODES, DERATING_STATUS_MAP, TENTHS_VALUE_KEYS
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -109,22 +109,18 @@ class CompleoSystemSensor(CoordinatorEntity, SensorEntity):
         self._attr_state_class = state_class
         self._attr_unique_id = f"{uid_prefix}_system_{key}"
         if icon: self._attr_icon = icon
+        if key in TENTHS_VALUE_KEYS: self._attr_suggested_display_precision = 1
 
     @property
     def native_value(self):
         if not self.coordinator.data: return None
-        return self.coordinator.data.get("system", {}).get(self._key)
+        val = self.coordinator.data.get("system", {}).get(self._key)
+        if val is not None and self._key in TENTHS_VALUE_KEYS: return val / 10
+        return val
 
     @property
     def device_info(self):
-        system_data = self.coordinator.data.get("system", {}) if self.coordinator.data else {}
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.host)},
-            "name": self.coordinator.device_name,
-            "manufacturer": "Compleo",
-            "model": system_data.get("article_number", "Compleo Wallbox"),
-            "sw_version": system_data.get("firmware_version", "Unknown"),
-        }
+        return self.coordinator.device_info_map
 
 class CompleoPointSensor(CoordinatorEntity, SensorEntity):
     _attr_has_entity_name = True
@@ -138,6 +134,7 @@ class CompleoPointSensor(CoordinatorEntity, SensorEntity):
         self._attr_state_class = state_class
         self._attr_icon = icon
         self._attr_unique_id = f"{uid_prefix}_lp{point_index}_{key}"
+        if key in TENTHS_VALUE_KEYS: self._attr_suggested_display_precision = 1
         
         if key == "status_code": self._attr_options = ["0", "1", "2", "3", "4", "5", "6", "7", "8"]
         elif key == "error_code": self._attr_options = list(CHARGE_POINT_ERROR_CODES.values())
@@ -152,6 +149,7 @@ class CompleoPointSensor(CoordinatorEntity, SensorEntity):
         if self._key == "error_code" and val is not None: return CHARGE_POINT_ERROR_CODES.get(val, "unknown_error")
         if self._key == "derating_status" and val is not None: return DERATING_STATUS_MAP.get(val, "unknown_status")
         if self._key == "status_code" and val is not None: return str(val)
+        if self._key in TENTHS_VALUE_KEYS and val is not None: return val / 10
         return val
 
     @property
@@ -223,6 +221,8 @@ class CompleoAccumulatedSensor(CoordinatorEntity, RestoreEntity, SensorEntity):
             
         if current_session is None:
             return
+        if self._source_key in TENTHS_VALUE_KEYS:
+            current_session = current_session / 10
 
         # Calculate Delta
         delta = current_session - self._last_session_value
@@ -244,12 +244,7 @@ class CompleoAccumulatedSensor(CoordinatorEntity, RestoreEntity, SensorEntity):
     def device_info(self):
         # Same logic as other sensors to attach to correct device
         if self._point_index == 0:
-            return {
-                "identifiers": {(DOMAIN, self.coordinator.host)},
-                "name": self.coordinator.device_name,
-                "manufacturer": "Compleo",
-                "model": "Wallbox (System)",
-            }
+            return self.coordinator.device_info_map
         else:
             return {
                 "identifiers": {(DOMAIN, f"{self.coordinator.host}_lp{self._point_index}")},
@@ -7,7 +7,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, ADDR_LP1_BASE, ADDR_LP2_BASE, OFFSET_PHASE_MODE
+from .const import DOMAIN, POINT_BASE_ADDRESSES, OFFSET_PHASE_MODE
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
     coordinator = hass.data[DOMAIN][entry.entry_id]
@@ -45,7 +45,7 @@ class CompleoZoeSwitch(CoordinatorEntity, SwitchEntity):
 
     async def async_turn_off(self, **kwargs):
         self.coordinator.logic.update_input(self._point_index, "zoe_mode", False)
-        base = ADDR_LP1_BASE if self._point_index == 1 else ADDR_LP2_BASE
+        base = POINT_BASE_ADDRESSES.get(self._point_index)
         if base is not None:
              await self.coordinator.async_write_register(base + OFFSET_PHASE_MODE, 1)
         self.async_write_ha_state()